@@ -7,14 +7,19 @@ single CSV file located in the local ``data`` directory.
 The script demonstrates a pragmatic approach to combining information
 from traditional HTML pages with PDF based circulars. The Meny circular
 is delivered as a PDF document and therefore requires text extraction.
-The remaining stores expose offer information in HTML which is parsed
-with BeautifulSoup.
+The remaining stores expose offer information in HTML. The etilbudsavis
+pages are parsed with BeautifulSoup using the ``lxml`` parser, while the
+simple selector based pages (Norli and Mester Grønn) use selectolax.
 
 Dependencies
 ------------
 * requests
+* requests-cache
 * beautifulsoup4
+* lxml
+* selectolax
 * pdfminer.six
+* orjson (optional, faster parsing of embedded JSON data)
 
 Usage
 -----
@@ -31,16 +36,30 @@ import csv
 import json
 import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
-from typing import Iterable, List
+from sys import intern
+from tempfile import SpooledTemporaryFile
+from threading import Lock
+from typing import IO, Iterable, Iterator, List
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
-from pdfminer.high_level import extract_text
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTContainer, LTItem, LTTextContainer
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 HEADERS = {
@@ -51,8 +70,56 @@ HEADERS = {
     )
 }
 
+# Transient failures are retried with exponential backoff at the transport
+# level, so a single flaky response does not cost a whole scraper run.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET"]),
+)
+
+_SESSION: CachedSession | None = None
+_SESSION_LOCK = Lock()
+
+# Regular expressions used in the hot parsing paths, compiled once.
+_PRICE_LINE_RE = re.compile(
+    r"^(?P<pre>.*?)(?P<price>\d+[\.,]\d{2}\s*kr?|kr\s*\d+[\.,]\d{2})(?P<post>.*)$",
+    re.I | re.S,
+)
+_PDF_URL_RE = re.compile(r"https?:\\?/?\\?/?[^'\"\s]+\.pdf", re.I)
+_PDF_QUOTED_RE = re.compile(r"[\'\"]([^'\"\s]+\.pdf)[\'\"]", re.I)
+_ESCAPED_SLASH_RE = re.compile(r"\\u002f", re.I)
+
+# CSS selectors compiled once by Soup Sieve. The ``i`` flag makes the class
+# substring matches case-insensitive.
+_OFFERCARD_SEL = soupsieve.compile('[class*="OfferCard"]')
+_PRICE_SEL = soupsieve.compile('[class*="price" i]')
+_DESC_SEL = soupsieve.compile('[class*="description" i], [class*="subtitle" i]')
+
+# Restricts parsing to the embedded Next.js data script on etilbudsavis.
+_NEXT_DATA_STRAINER = SoupStrainer("script", id="__NEXT_DATA__")
+
+# Selector for price elements on the Mester Grønn page, used with selectolax.
+_PRIS_SEL = '[class*="pris" i], [class*="price" i]'
+
+# Attributes that may carry the Meny PDF link, checked in one selector pass.
+_PDF_ATTR_SELECTOR = (
+    "a[href*='.pdf' i], iframe[src*='.pdf' i], "
+    "[data-src*='.pdf' i], [data-href*='.pdf' i]"
+)
+
+# Interned store names, shared by every Offer from the same store.
+STORES = {
+    name: intern(name)
+    for name in ("Meny", "Spar", "Kiwi", "Joker", "Norli", "Mester Grønn")
+}
+
+# Membership test used to spot PDF lines that may contain a price.
+_DIGIT_SET = frozenset("0123456789")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Offer:
     """Structured representation of a single offer line."""
 
@@ -61,20 +128,73 @@ class Offer:
     price: str | None = None
     extra: str | None = None
 
-    def as_row(self) -> List[str]:
-        return [self.store, self.title, self.price or "", self.extra or ""]
-
 
 class ScraperError(RuntimeError):
     """Raised when a scraping routine fails."""
 
 
+def get_session() -> CachedSession:
+    """Return the shared HTTP session, creating it on first use.
+
+    A single session keeps connections alive between requests, so repeated
+    fetches against the same host skip the TCP/TLS handshake. HTML
+    responses are cached on disk for an hour, so reruns on the same day do
+    not download the offer pages again. The session is built lazily so the
+    cache file is only created when something is actually fetched.
+    """
+
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = CachedSession(
+                "data/.http_cache",
+                backend="sqlite",
+                expire_after=3600,
+                allowable_methods=("GET",),
+            )
+            session.headers.update(HEADERS)
+            adapter = HTTPAdapter(
+                max_retries=_RETRY, pool_connections=8, pool_maxsize=16
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+        return _SESSION
+
+
 def fetch(url: str) -> requests.Response:
-    response = requests.get(url, headers=HEADERS, timeout=30)
+    response = get_session().get(url, timeout=30)
     response.raise_for_status()
     return response
 
 
+def fetch_to_file(url: str) -> SpooledTemporaryFile:
+    """Stream a download into a temporary file and rewind it.
+
+    Small bodies stay in memory, larger ones spill to disk, so big PDF
+    circulars never have to be held in memory as a single bytes object.
+    The response cache is bypassed here, because storing a response
+    requires reading its whole body up front.
+    """
+
+    buffer = SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    try:
+        with get_session().get(
+            url,
+            stream=True,
+            timeout=60,
+            headers={"Cache-Control": "no-store"},
+        ) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer.write(chunk)
+    except Exception:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer
+
+
 def parse_price_line(line: str) -> tuple[str, str | None]:
     """Split a text line into a probable title and price.
 
@@ -82,10 +202,14 @@ def parse_price_line(line: str) -> tuple[str, str | None]:
     patterns containing ``kr`` or comma separated decimals.
     """
 
-    price_match = re.search(r"(\d+[\.,]\d{2}\s*kr?|kr\s*\d+[\.,]\d{2})", line, flags=re.I)
+    # Every price pattern contains a "k", so lines without one can skip
+    # the regex entirely. Most circular lines fall into this group.
+    if "k" not in line and "K" not in line:
+        return line.strip(), None
+    price_match = _PRICE_LINE_RE.match(line)
     if price_match:
-        price = price_match.group(0).strip()
-        title = line.replace(price_match.group(0), "").strip(" -:")
+        price = intern(price_match["price"].strip())
+        title = (price_match["pre"] + price_match["post"]).strip(" -:")
         return title or line.strip(), price
     return line.strip(), None
 
@@ -113,104 +237,131 @@ def _find_pdf_in_data(data: object) -> str | None:
 def _find_pdf_in_attrs(soup: BeautifulSoup, base_url: str) -> str | None:
     """Search HTML attributes for a PDF link and return an absolute URL."""
 
-    for tag in soup.find_all(True):
-        for value in tag.attrs.values():
-            candidates: Iterable[str]
-            if isinstance(value, (list, tuple, set)):
-                candidates = (str(item) for item in value)
-            else:
-                candidates = (str(value),)
-            for candidate in candidates:
-                if ".pdf" not in candidate.lower():
-                    continue
-                return urljoin(base_url, candidate)
+    tag = soup.select_one(_PDF_ATTR_SELECTOR)
+    if tag is None:
+        return None
+    for attr in ("href", "src", "data-src", "data-href"):
+        value = tag.get(attr)
+        if value and ".pdf" in value.lower():
+            return urljoin(base_url, value)
     return None
 
 
-def scrape_meny() -> Iterable[Offer]:
-    page = fetch("https://kundeavis.meny.no/")
-    soup = BeautifulSoup(page.text, "html.parser")
-
-    pdf_url = None
+def _find_pdf_in_text(text: str, base_url: str) -> str | None:
+    """Search raw page text for an absolute or quoted relative PDF URL."""
 
-    def _load_json_from_script(script: BeautifulSoup) -> object | None:
-        if not script:
-            return None
-        raw = script.string or script.text
-        if not raw:
-            return None
+    absolute_match = _PDF_URL_RE.search(text)
+    if not absolute_match:
+        # Only build the unescaped copy of the page when the plain search
+        # comes up empty.
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            return None
+            unescaped = bytes(text, "utf-8").decode("unicode_escape")
+        except UnicodeDecodeError:
+            pass
+        else:
+            absolute_match = _PDF_URL_RE.search(unescaped)
+    if absolute_match:
+        candidate = absolute_match.group(0).replace("\\/", "/")
+        return _ESCAPED_SLASH_RE.sub("/", candidate)
+
+    relative_match = _PDF_QUOTED_RE.search(text)
+    if relative_match:
+        return urljoin(base_url, relative_match.group(1))
+    return None
 
-    data_tag = soup.find("script", id="__NEXT_DATA__")
-    primary_data = _load_json_from_script(data_tag)
-    if primary_data is not None:
-        found = _find_pdf_in_data(primary_data)
-        if found:
-            pdf_url = urljoin(page.url, found)
 
-    if not pdf_url:
-        for script in soup.find_all("script"):
-            data = _load_json_from_script(script)
-            if data is None:
-                continue
-            found = _find_pdf_in_data(data)
-            if found:
-                pdf_url = urljoin(page.url, found)
-                break
+def _iter_text_containers(item: LTItem) -> Iterator[LTTextContainer]:
+    """Yield text containers from a layout item, including nested figures."""
 
-    if not pdf_url:
-        pdf_url = _find_pdf_in_attrs(soup, page.url)
+    if isinstance(item, LTTextContainer):
+        yield item
+    elif isinstance(item, LTContainer):
+        for child in item:
+            yield from _iter_text_containers(child)
 
-    if not pdf_url:
-        text_variants = [page.text]
-        try:
-            text_variants.append(bytes(page.text, "utf-8").decode("unicode_escape"))
-        except UnicodeDecodeError:
-            pass
-        for text in text_variants:
-            absolute_match = re.search(r"https?:\\?/?\\?/?[^'\"\s]+\.pdf", text, flags=re.I)
-            if absolute_match:
-                candidate = absolute_match.group(0).replace("\\/", "/")
-                candidate = re.sub(r"\\u002f", "/", candidate, flags=re.I)
-                pdf_url = candidate
-                break
 
-    if pdf_url and not pdf_url.lower().startswith("http"):
-        pdf_url = urljoin(page.url, pdf_url)
+def _iter_pdf_lines(pdf_file: IO[bytes]) -> Iterator[str]:
+    """Yield text lines from a PDF one text box at a time.
+
+    Pages are laid out lazily, so the whole document text is never held
+    in memory as a single string. Text inside figures (Form XObjects) is
+    laid out as well, since circulars often place offer boxes there.
+    """
+
+    for page in extract_pages(pdf_file, laparams=LAParams(all_texts=True)):
+        for container in _iter_text_containers(page):
+            yield from container.get_text().splitlines()
+
+
+def scrape_meny() -> Iterable[Offer]:
+    page = fetch("https://kundeavis.meny.no/")
+
+    # The raw text search is cheap and usually succeeds, so only build the
+    # HTML tree when it comes up empty.
+    pdf_url = _find_pdf_in_text(page.text, page.url)
 
     if not pdf_url:
-        relative_match = re.search(r"[\'\"]([^'\"\s]+\.pdf)[\'\"]", page.text, flags=re.I)
-        if relative_match:
-            pdf_url = urljoin(page.url, relative_match.group(1))
+        soup = BeautifulSoup(page.content, "lxml")
+
+        def _load_json_from_script(script: BeautifulSoup) -> object | None:
+            if not script:
+                return None
+            raw = script.string or script.text
+            if not raw:
+                return None
+            try:
+                return json.loads(raw)
+            except json.JSONDecodeError:
+                return None
+
+        data_tag = soup.find("script", id="__NEXT_DATA__")
+        primary_data = _load_json_from_script(data_tag)
+        if primary_data is not None:
+            found = _find_pdf_in_data(primary_data)
+            if found:
+                pdf_url = urljoin(page.url, found)
+
+        if not pdf_url:
+            for script in soup.find_all("script"):
+                data = _load_json_from_script(script)
+                if data is None:
+                    continue
+                found = _find_pdf_in_data(data)
+                if found:
+                    pdf_url = urljoin(page.url, found)
+                    break
+
+        if not pdf_url:
+            pdf_url = _find_pdf_in_attrs(soup, page.url)
 
     if not pdf_url:
         raise ScraperError("Fant ikke PDF-lenken på Meny-siden.")
 
-    pdf_response = fetch(pdf_url)
-    pdf_text = extract_text(BytesIO(pdf_response.content))
     offers: List[Offer] = []
-    for raw_line in pdf_text.splitlines():
-        clean = raw_line.strip()
-        if not clean:
-            continue
-        if re.search(r"\d", clean):
-            title, price = parse_price_line(clean)
-            offers.append(Offer(store="Meny", title=title, price=price))
+    with fetch_to_file(pdf_url) as pdf_file:
+        for raw_line in _iter_pdf_lines(pdf_file):
+            clean = raw_line.strip()
+            if not clean:
+                continue
+            if not _DIGIT_SET.isdisjoint(clean):
+                title, price = parse_price_line(clean)
+                offers.append(Offer(store=STORES["Meny"], title=title, price=price))
     return offers
 
 
-def _extract_etilbudsavis_offers(html: str, store_name: str) -> Iterable[Offer]:
-    soup = BeautifulSoup(html, "html.parser")
+def _extract_etilbudsavis_offers(content: bytes, store_name: str) -> Iterable[Offer]:
     offers: List[Offer] = []
 
-    # Newer versions of etilbudsavis.no expose data inside __NEXT_DATA__
-    data_tag = soup.find("script", id="__NEXT_DATA__")
+    # Newer versions of etilbudsavis.no expose data inside __NEXT_DATA__.
+    # Only that script is parsed here; the full tree is built on fallback.
+    script_soup = BeautifulSoup(content, "lxml", parse_only=_NEXT_DATA_STRAINER)
+    data_tag = script_soup.find("script", id="__NEXT_DATA__")
     if data_tag and data_tag.string:
         try:
-            data = json.loads(data_tag.string)
+            if orjson is not None:
+                data = orjson.loads(data_tag.encode_contents())
+            else:
+                data = json.loads(data_tag.string)
             catalogue = data["props"]["pageProps"].get("catalogue")
             if catalogue:
                 items = catalogue.get("offers") or catalogue.get("items")
@@ -230,12 +381,15 @@ def _extract_etilbudsavis_offers(html: str, store_name: str) -> Iterable[Offer]:
                             )
         except (KeyError, ValueError, TypeError):
             pass
+    if offers:
+        return offers
 
     # Fallback: parse visible offer cards
-    for card in soup.select("[class*=OfferCard]"):
+    soup = BeautifulSoup(content, "lxml")
+    for card in _OFFERCARD_SEL.select(soup):
         title = card.find(["h2", "h3", "h4"])
-        price = card.find(class_=re.compile("price", re.I))
-        extra = card.find(class_=re.compile("description|subtitle", re.I))
+        price = _PRICE_SEL.select_one(card)
+        extra = _DESC_SEL.select_one(card)
         if title:
             offers.append(
                 Offer(
@@ -252,26 +406,39 @@ def _extract_etilbudsavis_offers(html: str, store_name: str) -> Iterable[Offer]:
 def scrape_etilbudsavis(store_slug: str, store_name: str) -> Iterable[Offer]:
     url = f"https://etilbudsavis.no/{store_slug}"
     response = fetch(url)
-    return _extract_etilbudsavis_offers(response.text, store_name)
+    return _extract_etilbudsavis_offers(response.content, store_name)
+
+
+def _select_descendant(node: LexborNode, selector: str) -> LexborNode | None:
+    """Return the first descendant of ``node`` matching ``selector``.
+
+    selectolax may match the node itself, unlike BeautifulSoup's
+    ``select_one``, so the container is skipped explicitly.
+    """
+
+    return next(
+        (match for match in node.css(selector) if match.mem_id != node.mem_id),
+        None,
+    )
 
 
 def scrape_norli() -> Iterable[Offer]:
     response = fetch("https://www.norli.no/kampanje/tilbud")
-    soup = BeautifulSoup(response.text, "html.parser")
+    tree = LexborHTMLParser(response.text)
     offers: List[Offer] = []
 
-    for item in soup.select(".product-item-info"):
-        title_el = item.select_one(".product-item-link")
-        price_el = item.select_one(".price")
-        extra_el = item.select_one(".special-price .price")
-        title = title_el.get_text(strip=True) if title_el else None
+    for item in tree.css(".product-item-info"):
+        title_el = _select_descendant(item, ".product-item-link")
+        price_el = _select_descendant(item, ".price")
+        extra_el = _select_descendant(item, ".special-price .price")
+        title = title_el.text(strip=True) if title_el else None
         if not title:
             continue
-        base_price = price_el.get_text(strip=True) if price_el else None
-        special = extra_el.get_text(strip=True) if extra_el else None
+        base_price = price_el.text(strip=True) if price_el else None
+        special = extra_el.text(strip=True) if extra_el else None
         offers.append(
             Offer(
-                store="Norli",
+                store=STORES["Norli"],
                 title=title,
                 price=special or base_price,
                 extra=f"Førpris: {base_price}" if special and base_price else None,
@@ -283,22 +450,22 @@ def scrape_norli() -> Iterable[Offer]:
 
 def scrape_mester_gronn() -> Iterable[Offer]:
     response = fetch("https://www.mestergronn.no/mg/ukens-tilbud.html")
-    soup = BeautifulSoup(response.text, "html.parser")
+    tree = LexborHTMLParser(response.text)
     offers: List[Offer] = []
 
-    for block in soup.select(".mg-box"):
-        title_el = block.find(["h2", "h3"])
-        price_el = block.find(class_=re.compile("pris|price", re.I))
-        desc_el = block.find("p")
-        title = title_el.get_text(strip=True) if title_el else None
+    for block in tree.css(".mg-box"):
+        title_el = _select_descendant(block, "h2, h3")
+        price_el = _select_descendant(block, _PRIS_SEL)
+        desc_el = _select_descendant(block, "p")
+        title = title_el.text(strip=True) if title_el else None
         if not title:
             continue
         offers.append(
             Offer(
-                store="Mester Grønn",
+                store=STORES["Mester Grønn"],
                 title=title,
-                price=price_el.get_text(strip=True) if price_el else None,
-                extra=desc_el.get_text(strip=True) if desc_el else None,
+                price=price_el.text(strip=True) if price_el else None,
+                extra=desc_el.text(strip=True) if desc_el else None,
             )
         )
 
@@ -307,9 +474,9 @@ def scrape_mester_gronn() -> Iterable[Offer]:
 
 SCRAPERS = [
     scrape_meny,
-    lambda: scrape_etilbudsavis("Spar", "Spar"),
-    lambda: scrape_etilbudsavis("KIWI", "Kiwi"),
-    lambda: scrape_etilbudsavis("Joker", "Joker"),
+    lambda: scrape_etilbudsavis("Spar", STORES["Spar"]),
+    lambda: scrape_etilbudsavis("KIWI", STORES["Kiwi"]),
+    lambda: scrape_etilbudsavis("Joker", STORES["Joker"]),
     scrape_norli,
     scrape_mester_gronn,
 ]
@@ -317,11 +484,16 @@ SCRAPERS = [
 
 def collect_offers() -> List[Offer]:
     offers: List[Offer] = []
-    for scraper in SCRAPERS:
-        try:
-            offers.extend(list(scraper()))
-        except Exception as exc:  # pragma: no cover - defensive logging
-            print(f"Advarsel: klarte ikke hente tilbud: {exc}")
+    # The scrapers are independent and network bound, so run them
+    # concurrently. Results are gathered in SCRAPERS order to keep the
+    # CSV output stable.
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as executor:
+        futures = [executor.submit(scraper) for scraper in SCRAPERS]
+        for future in futures:
+            try:
+                offers.extend(list(future.result()))
+            except Exception as exc:  # pragma: no cover - defensive logging
+                print(f"Advarsel: klarte ikke hente tilbud: {exc}")
     return offers
 
 
@@ -342,7 +514,7 @@ def load_sample_offers() -> List[Offer]:
     for item in raw_offers:
         offers.append(
             Offer(
-                store=item.get("store", "Ukjent"),
+                store=intern(item.get("store", "Ukjent")),
                 title=item["title"],
                 price=item.get("price"),
                 extra=item.get("extra"),
@@ -352,11 +524,15 @@ def load_sample_offers() -> List[Offer]:
 
 
 def write_csv(rows: Iterable[Offer], output_path: Path) -> None:
-    with output_path.open("w", newline="", encoding="utf-8") as handle:
+    with output_path.open(
+        "w", newline="", encoding="utf-8", buffering=1 << 20
+    ) as handle:
         writer = csv.writer(handle)
         writer.writerow(["butikk", "tittel", "pris", "ekstrainfo"])
-        for offer in rows:
-            writer.writerow(offer.as_row())
+        writer.writerows(
+            (offer.store, offer.title, offer.price or "", offer.extra or "")
+            for offer in rows
+        )
 
 
 def main(argv: List[str] | None = None) -> None:
@@ -371,6 +547,7 @@ def main(argv: List[str] | None = None) -> None:
     if args.use_sample_data:
         offers = load_sample_offers()
     else:
+        get_session().cache.delete(expired=True)
         offers = collect_offers()
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     output_path = Path("data") / f"trumf-tilbud-{timestamp}.csv"